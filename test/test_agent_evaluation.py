@@ -1,3 +1,4 @@
+import re
 import asyncio
 import logging
 import time
@@ -22,17 +23,17 @@ APP_NAME = "Theophrastus_app"
 USER_ID = "test_user"
 SESSION_ID = "test_Theophrastus"
 
+_RULE = "=" * 80
+
+_JSON_OBJECT_START_RE = re.compile(r"\s*\{")
+_SNAPSHOT_KEY_RE = re.compile(r'"(?:current|hourly|location|raw)"')
+
 def _looks_like_env_snapshot_json(text: str) -> bool:
   """Filter out raw environmental snapshot JSON from display"""
-  if not text:
-    return False
-  
-  t = text.strip()
-  if not t.startswith("{"):
+  if not text or not _JSON_OBJECT_START_RE.match(text):
     return False
   
-  suspicious_keys = ['"current"', '"hourly"', '"location"', '"raw"']
-  return any(k in t for k in suspicious_keys)
+  return _SNAPSHOT_KEY_RE.search(text) is not None
 
 
 async def main():
@@ -94,13 +95,16 @@ async def main():
     complexity = test_case["complexity"]
     description = test_case["description"]
     
-    print(f"\n{'='*80}\n")
-    print(f"TEST CASE {i}/{len(test_cases)}")
-    print(f"Description: {description}")
-    print(f"Complexity: {complexity}")
-    print(f"\n{'='*80}")
-    print(f"\n>>> USER: {query}\n")
-    print(f"{'='*80}")
+    print(
+      f"\n{_RULE}\n",
+      f"TEST CASE {i}/{len(test_cases)}",
+      f"Description: {description}",
+      f"Complexity: {complexity}",
+      f"\n{_RULE}",
+      f"\n>>> USER: {query}\n",
+      _RULE,
+      sep="\n"
+    )
     
     last_user_facing_text = None
     start_time = time.time()
@@ -148,20 +152,15 @@ async def main():
     end_time = time.time()
     duration = end_time - start_time
     
-    print(f"\n{"="*80}\n")
     if last_user_facing_text:
-        print(f">>> THEOPHRASTUS: {last_user_facing_text}")
+      response_line = f">>> THEOPHRASTUS: {last_user_facing_text}"
     else:
-      print(">>> THEOPHRASTUS: [No user-facing text in response]\n")
-    print(f"\n{"="*80}\n")
-    
-    print(f"Response time: {duration:.2f} seconds")
+      response_line = ">>> THEOPHRASTUS: [No user-facing text in response]\n"
+    print(f"\n{_RULE}\n", response_line, f"\n{_RULE}\n", f"Response time: {duration:.2f} seconds", sep="\n")
     
     evaluation_state = session_cache.get_evaluation_data(SESSION_ID)
     
-    print(f"="*80)
-    print("RUNNING EVALUATION...")
-    print(f"="*80)
+    print(_RULE, "RUNNING EVALUATION...", _RULE, sep="\n")
     
     evaluation_report = evaluator.run_full_evaluation(
       session_id=f"{SESSION_ID}_test_{i}",
@@ -244,4 +243,9 @@ async def main():
   print("="*80)
 
 if __name__ == "__main__":
-  asyncio.run(main())
\ No newline at end of file
+  try:
+    import uvloop
+  except ImportError:
+    asyncio.run(main())
+  else:
+    uvloop.run(main())
\ No newline at end of file
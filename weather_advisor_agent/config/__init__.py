@@ -1,3 +1,18 @@
-from weather_advisor_agent.config.main_config import TheophrastusConfiguration 
+from weather_advisor_agent.config.main_config import TheophrastusConfiguration, MAX_ENV_FETCH_ITER
+from weather_advisor_agent.config.prompts_storage import (THEOPHRASTUS_INSTRUCTION,
+  ZEPHYR_INSTRUCTION,
+  ATLAS_DISCOVERY_INSTRUCTION,
+  ATLAS_GEOCODE_INSTRUCTION,
+  AETHER_INSTRUCTION,
+  AURORA_INSTRUCTION
+)
 
-__all__ = ["TheophrastusConfiguration"]
\ No newline at end of file
+__all__ = ["TheophrastusConfiguration",
+  "MAX_ENV_FETCH_ITER",
+  "THEOPHRASTUS_INSTRUCTION",
+  "ZEPHYR_INSTRUCTION",
+  "ATLAS_DISCOVERY_INSTRUCTION",
+  "ATLAS_GEOCODE_INSTRUCTION",
+  "AETHER_INSTRUCTION",
+  "AURORA_INSTRUCTION"
+]
\ No newline at end of file
@@ -3,6 +3,7 @@ import logging
 
 from google.genai import types
 from dataclasses import dataclass, field
+from typing import Final
 from dotenv import load_dotenv
 
 def _configure_env() -> None:
@@ -12,6 +13,10 @@ def _configure_env() -> None:
 _configure_env()
 
 logging.basicConfig(level=logging.INFO,format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+logging.logThreads = False
+logging.logProcesses = False
+
+MAX_ENV_FETCH_ITER: Final[int] = 2
 
 @dataclass
 class TheophrastusConfiguration:
@@ -19,7 +24,7 @@ class TheophrastusConfiguration:
   critic_model: str = "gemini-2.5-pro"
   mapper_model: str = "gemini-2.0-flash-lite"
   writer_model: str = "gemini-2.0-flash-lite"
-  max_iterations: int = 2
+  max_iterations: int = MAX_ENV_FETCH_ITER
   
   model_params: dict = field(default_factory=lambda: {
     "temperature": 0.2,
@@ -1,6 +1,6 @@
 from .zephyr_env_data_agent import zephyr_env_data_agent, robust_env_data_agent
 from .aether_env_risk_agent import aether_env_risk_agent, robust_env_risk_agent
-from.aurora_env_advice_writer import aurora_env_advice_writer
+from .aurora_env_advice_writer import aurora_env_advice_writer
 from .atlas_env_location_agent import (
   atlas_env_location_geocode_agent,
   atlas_env_location_discovery_agent,
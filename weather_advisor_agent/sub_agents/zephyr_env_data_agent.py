@@ -1,4 +1,3 @@
-import json
 import logging
 
 from google.genai.types import Content, Part
@@ -6,32 +5,38 @@ from google.adk.tools import FunctionTool
 from google.adk.agents import Agent, LoopAgent
 from google.adk.agents.callback_context import CallbackContext
 
-from weather_advisor_agent.config import TheophrastusConfiguration
+from weather_advisor_agent.config import TheophrastusConfiguration, MAX_ENV_FETCH_ITER, ZEPHYR_INSTRUCTION
 
-from weather_advisor_agent.tools import (geocode_place_name,fetch_and_store_snapshot,get_last_snapshot)
+from weather_advisor_agent.tools import (geocode_place_name,fetch_and_store_snapshot,fetch_and_store_snapshots)
 
-from weather_advisor_agent.utils import Theophrastus_Observability, session_cache
+from weather_advisor_agent.utils import Theophrastus_Observability
 
 from weather_advisor_agent.utils.validation_checkers import EnvSnapshotValidationChecker
 
 
 logger = logging.getLogger(__name__)
 
+def zephyr_reset_callback(callback_context: CallbackContext) -> None:
+  """Clears the snapshot from a previous fetch so only this run's data counts"""
+  callback_context.state["env_snapshot"] = None
+  return None
+
 def zephyr_data_callback(callback_context: CallbackContext) -> Content:
   """Callback for zephyr agent - stores weather snapshot data"""
-  last_snapshot = get_last_snapshot()
+  last_snapshot = callback_context.state.get("env_snapshot")
   
-  if last_snapshot:
-    callback_context.session.state["env_snapshot"] = json.dumps(last_snapshot)
-    session_cache.store_evaluation_data(callback_context.session.id,{"env_snapshot": last_snapshot})
-    
+  # zephyr_reset_callback cleared the key, so anything here was fetched by this run's tools.
+  # The tools already stored it in state and session_cache as parsed JSON.
+  if last_snapshot and isinstance(last_snapshot, (dict, list)):
     Theophrastus_Observability.log_agent_complete("zephyr_env_data_agent", "env_snapshot", success=True)
     logger.info("Stored snapshot. | ")
     
-    current = last_snapshot.get("current", {})
-    temp = current.get("temperature_c", "?")
-    wind = current.get("wind_speed_10m_ms", "?")
-    logger.info(f"Data: {temp}°C, {wind} m/s wind. |")
+    if logger.isEnabledFor(logging.INFO):
+      if isinstance(last_snapshot, dict):
+        current = last_snapshot.get("current") or {}
+        logger.info("Data: %s°C, %s m/s wind. |", current.get("temperature_c", "?"), current.get("wind_speed_10m_ms", "?"))
+      else:
+        logger.info("Data for %d locations. |", len(last_snapshot))
     
     return Content(parts=[])
   else:
@@ -44,11 +49,9 @@ zephyr_env_data_agent = Agent(
   model=TheophrastusConfiguration.worker_model,
   name="zephyr_env_data_agent",
   description="Fetches live environmental data.",
-  instruction="""
-  Extract location from user message.
-  Call geocode_place_name, then call fetch_and_store_snapshot with coordinates.
-  """,
-  tools=[FunctionTool(fetch_and_store_snapshot),FunctionTool(geocode_place_name)],
+  instruction=ZEPHYR_INSTRUCTION,
+  tools=[FunctionTool(fetch_and_store_snapshot),FunctionTool(fetch_and_store_snapshots),FunctionTool(geocode_place_name)],
+  before_agent_callback=zephyr_reset_callback,
   after_agent_callback=zephyr_data_callback
 )
 
@@ -56,5 +59,5 @@ robust_env_data_agent = LoopAgent(
   name="robust_env_data_agent",
   description="Robust environmental data fetcher with retries.",
   sub_agents=[zephyr_env_data_agent,EnvSnapshotValidationChecker(name="env_snapshot_validation_checker")],
-  max_iterations=2
+  max_iterations=MAX_ENV_FETCH_ITER
 )
\ No newline at end of file
@@ -1,8 +1,10 @@
 from .creation_tools import save_env_report_to_file
 from .web_access_tools import (geocode_place_name, 
+  geocode_places_batch,
   fetch_env_snapshot_from_open_meteo,
+  fetch_env_snapshots_from_open_meteo,
   fetch_and_store_snapshot, 
-  get_last_snapshot
+  fetch_and_store_snapshots
 )
 from .memory_tools import (store_user_preference,
   get_user_preferences,
@@ -16,10 +18,11 @@ from .memory_tools import (store_user_preference,
 
 __all__ = ["save_env_report_to_file",
   "geocode_place_name",
+  "geocode_places_batch",
   "fetch_env_snapshot_from_open_meteo",
+  "fetch_env_snapshots_from_open_meteo",
   "fetch_and_store_snapshot", 
-  "get_last_snapshot",
-  "parse_json_string",
+  "fetch_and_store_snapshots",
   "store_user_preference",
   "get_user_preferences",
   "add_to_query_history",
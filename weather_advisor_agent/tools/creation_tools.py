@@ -1,14 +1,23 @@
+import asyncio
 import datetime
 from pathlib import Path
 
-def save_env_report_to_file(report_markdown: str, filename: str) -> str:
+_REPORTS_DIR = Path("reports")
+
+def _write_report(full_path: Path, report_markdown: str) -> None:
+  try:
+    full_path.write_text(report_markdown, encoding="utf-8")
+  except FileNotFoundError:
+    # Only the first report (or one in a new subfolder) needs the directory created.
+    full_path.parent.mkdir(parents=True, exist_ok=True)
+    full_path.write_text(report_markdown, encoding="utf-8")
+
+async def save_env_report_to_file(report_markdown: str, filename: str) -> str:
   """Saves report to .md format"""
-  base_dir = Path("reports")
   file = f"{filename}_recommendations_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
-  full_path = base_dir / file
-  full_path.parent.mkdir(parents=True, exist_ok=True)
+  full_path = _REPORTS_DIR / file
 
-  with open(full_path, "w", encoding="utf-8") as f:
-    f.write(report_markdown)
+  # Runs inside the agent's event loop; keep disk I/O off it.
+  await asyncio.to_thread(_write_report, full_path, report_markdown)
 
   return f"Report saved to: {full_path}"
\ No newline at end of file
@@ -30,6 +30,13 @@ def get_user_preferences(tool_context) -> Dict[str, Any]:
     "count": len(preferences)
   }
 
+def _search_blob(location: Optional[str], activity: Optional[str], weather_summary: Optional[str]) -> str:
+  # NUL can't appear in a search term, so a match never spans two fields.
+  return "\x00".join(filter(None, (location, activity, weather_summary))).casefold()
+
+def _public_query(query: Dict[str, Any]) -> Dict[str, Any]:
+  return {k: v for k, v in query.items() if k != "_search_blob"}
+
 def add_to_query_history(tool_context,location: str,activity: Optional[str] = None, weather_summary: Optional[str] = None  ) -> Dict[str, Any]:
   """Add a location query to the history (persists across sessions)."""
   history = tool_context.state.get("user:query_history", [])
@@ -38,7 +45,8 @@ def add_to_query_history(tool_context,location: str,activity: Optional[str] = No
     "timestamp": datetime.now().isoformat(),
     "location": location,
     "activity": activity,
-    "weather_summary": weather_summary
+    "weather_summary": weather_summary,
+    "_search_blob": _search_blob(location, activity, weather_summary)
   }
   history.append(query)
   history = history[-20:]
@@ -66,7 +74,7 @@ def get_query_history(tool_context,limit: int = 10) -> Dict[str, Any]:
   
   return {
     "status": "success",
-    "queries": recent,
+    "queries": [_public_query(q) for q in recent],
     "count": len(recent),
     "total_in_history": len(history)
   }
@@ -83,13 +91,15 @@ def search_query_history(tool_context,search_term: str) -> Dict[str, Any]:
       "matches": []
     }
   
-  search_lower = search_term.lower()
+  search_folded = search_term.casefold()
   matches = []
   for query in history:
-    if (search_lower in query.get("location", "").lower() or
-      search_lower in query.get("activity", "").lower() or
-      search_lower in query.get("weather_summary", "").lower()):
-      matches.append(query)
+    # Entries recorded before _search_blob existed get one built on the fly.
+    blob = query.get("_search_blob")
+    if blob is None:
+      blob = _search_blob(query.get("location"), query.get("activity"), query.get("weather_summary"))
+    if search_folded in blob:
+      matches.append(_public_query(query))
   
   return {
     "status": "success",
@@ -1,14 +1,196 @@
-import requests
+import atexit
+import asyncio
+import functools
+import httpx
 import time
 import logging
+import threading
+import unicodedata
 
-from typing import Dict, List, Any, cast, Optional
+import orjson
 
-from weather_advisor_agent.utils import Theophrastus_Observability
+from collections import OrderedDict
+from typing import Dict, List, Any, Tuple, cast, Optional
+
+from weather_advisor_agent.utils import Theophrastus_Observability, session_cache
 
 logger = logging.getLogger(__name__)
 
-def geocode_place_name(place_name: str, max_results: int = 3, region_hint: Optional[str] = None) -> Dict[str, Any]:
+_FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+_FORECAST_CURRENT = [
+  "temperature_2m",
+  "apparent_temperature",
+  "relative_humidity_2m",
+  "wind_speed_10m"
+]
+_FORECAST_HOURLY = ["pm10", "pm2_5"]
+# Risk scoring only looks at the day ahead; the API returns a full week by default.
+_HOURLY_WINDOW = 24
+
+# Open-Meteo's free tier allows roughly 10 requests per second.
+_OPEN_METEO_MAX_IN_FLIGHT = 8
+
+# One client per event loop: pooled connections belong to the loop that opened them.
+_clients: Dict[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, asyncio.Semaphore]] = {}
+_clients_lock = threading.Lock()
+
+def _get_client() -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+  """Shared pooled HTTP client and request slots for the running event loop"""
+  loop = asyncio.get_running_loop()
+  entry = _clients.get(loop)
+  if entry is None or entry[0].is_closed:
+    # retries only covers failed connects; the pooled connections are reused across calls.
+    transport = httpx.AsyncHTTPTransport(retries=2, limits=httpx.Limits(max_keepalive_connections=100))
+    entry = (httpx.AsyncClient(timeout=10.0, transport=transport), asyncio.Semaphore(_OPEN_METEO_MAX_IN_FLIGHT))
+    with _clients_lock:
+      # A finished loop can't run aclose() any more; forget its client so the pool is garbage-collected.
+      for stale in [l for l in _clients if l.is_closed()]:
+        del _clients[stale]
+      _clients[loop] = entry
+  return entry
+
+class CircuitOpenError(httpx.HTTPError):
+  """Raised without a network call while Open-Meteo is considered down"""
+
+class _CircuitBreaker:
+  """Fails fast after repeated provider failures, letting one probe through per cool-down"""
+  def __init__(self, failure_threshold: int, reset_timeout_s: float):
+    self.failure_threshold = failure_threshold
+    self.reset_timeout_s = reset_timeout_s
+    self._failures = 0
+    self._opened_at: Optional[float] = None
+    self._lock = threading.Lock()
+
+  def allow(self) -> bool:
+    with self._lock:
+      if self._opened_at is None:
+        return True
+      now = time.monotonic()
+      if now - self._opened_at < self.reset_timeout_s:
+        return False
+      # Half-open: re-arm the timer so only this caller probes until it reports back.
+      self._opened_at = now
+      return True
+
+  def record_success(self) -> None:
+    with self._lock:
+      self._failures = 0
+      self._opened_at = None
+
+  def record_failure(self) -> None:
+    with self._lock:
+      self._failures += 1
+      if self._failures >= self.failure_threshold:
+        self._opened_at = time.monotonic()
+
+_breaker = _CircuitBreaker(failure_threshold=5, reset_timeout_s=30.0)
+
+# Identical requests already in flight, so concurrent callers share one response.
+_inflight: Dict[Tuple[Any, ...], "asyncio.Future[httpx.Response]"] = {}
+
+def _request_key(url: str, params: Dict[str, Any], kwargs: Dict[str, Any]) -> Tuple[Any, ...]:
+  # Request options such as timeout are part of the key, so callers only share a request made their way.
+  return (url,
+    tuple((k, tuple(v) if isinstance(v, list) else v) for k, v in sorted(params.items())),
+    tuple(sorted(kwargs.items())))
+
+def _inflight_done(key: Tuple[Any, ...], task: "asyncio.Future[httpx.Response]") -> None:
+  if _inflight.get(key) is task:
+    del _inflight[key]
+  if not task.cancelled():
+    # Mark the error as retrieved even if every waiter was cancelled.
+    task.exception()
+
+async def _open_meteo_get(url: str, params: Dict[str, Any], **kwargs: Any) -> httpx.Response:
+  """GET through the shared client, coalescing identical concurrent requests"""
+  key = _request_key(url, params, kwargs)
+  try:
+    task = _inflight.get(key)
+  except TypeError:
+    # Unhashable option values (e.g. an httpx.Timeout) can't be matched; send the request on its own.
+    return await _open_meteo_fetch(url, params=params, **kwargs)
+  if task is None or task.get_loop() is not asyncio.get_running_loop():
+    task = asyncio.ensure_future(_open_meteo_fetch(url, params=params, **kwargs))
+    _inflight[key] = task
+    task.add_done_callback(functools.partial(_inflight_done, key))
+  # shield: one caller giving up must not cancel the request for the others.
+  return await asyncio.shield(task)
+
+async def _open_meteo_fetch(url: str, **kwargs: Any) -> httpx.Response:
+  """GET through the shared client, capping concurrent Open-Meteo requests"""
+  if not _breaker.allow():
+    raise CircuitOpenError("Open-Meteo circuit open, skipping request")
+  client, request_slots = _get_client()
+  async with request_slots:
+    try:
+      resp = await client.get(url, **kwargs)
+    except httpx.TransportError:
+      _breaker.record_failure()
+      raise
+  if resp.status_code >= 500:
+    _breaker.record_failure()
+  else:
+    _breaker.record_success()
+  return resp
+
+@atexit.register
+def _close_clients() -> None:
+  for loop, (client, _) in list(_clients.items()):
+    if not client.is_closed and not loop.is_closed() and not loop.is_running():
+      loop.run_until_complete(client.aclose())
+
+_GEOCODE_CACHE_SIZE = 4096
+_GEOCODE_CACHE_TTL_S = 24 * 60 * 60.0
+_GEOCODE_PROVIDER_VERSION = "open-meteo-geocoding-v1"
+_geocode_cache: "OrderedDict[Tuple[str, str, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_geocode_cache_lock = threading.Lock()
+
+def _normalize_place(text: Optional[str]) -> str:
+  """Folds case, Unicode forms, commas and extra spaces so equivalent spellings share a key"""
+  text = unicodedata.normalize("NFKC", text or "").casefold()
+  return " ".join(text.replace(",", " ").split())
+
+def _geocode_cache_key(place_name: str, region_hint: Optional[str], max_results: int) -> Tuple[str, str, str, int]:
+  return (_GEOCODE_PROVIDER_VERSION, _normalize_place(place_name), _normalize_place(region_hint), max_results)
+
+def _geocode_cache_get(key: Tuple[str, str, str, int]) -> Optional[Dict[str, Any]]:
+  with _geocode_cache_lock:
+    hit = _geocode_cache.get(key)
+    if hit is None:
+      return None
+    if time.monotonic() - hit[0] >= _GEOCODE_CACHE_TTL_S:
+      del _geocode_cache[key]
+      return None
+    _geocode_cache.move_to_end(key)
+    return hit[1]
+
+def _geocode_cache_put(key: Tuple[str, str, str, int], value: Dict[str, Any]) -> None:
+  with _geocode_cache_lock:
+    _geocode_cache[key] = (time.monotonic(), value)
+    _geocode_cache.move_to_end(key)
+    if len(_geocode_cache) > _GEOCODE_CACHE_SIZE:
+      _geocode_cache.popitem(last=False)
+
+# Landmark-type words the geocoder often doesn't index, keyed by their last word.
+# Longest first within a key so "National Park" wins over "Park".
+_PLACE_SUFFIXES = {
+  "park": (" national park", " state park", " park"),
+  "forest": (" forest",),
+  "mountain": (" mountain",),
+  "volcano": (" volcano",),
+  "trail": (" trail",),
+  "reserve": (" reserve",)
+}
+
+def _strip_place_suffix(name: str) -> Optional[str]:
+  lowered = name.lower()
+  last_word = lowered.rsplit(None, 1)[-1] if lowered else ""
+  for suffix in _PLACE_SUFFIXES.get(last_word, ()):
+    if lowered.endswith(suffix):
+      return name[:-len(suffix)].strip() or None
+  return None
+
+async def geocode_place_name(place_name: str, max_results: int = 3, region_hint: Optional[str] = None) -> Dict[str, Any]:
   """Geocodes a place name to coordinates using Open-Meteo Geocoding API"""
   
   start_time = time.time()
@@ -21,11 +203,18 @@ def geocode_place_name(place_name: str, max_results: int = 3, region_hint: Optio
     }
   )
   
+  cache_key = _geocode_cache_key(place_name, region_hint, max_results)
+  cached = _geocode_cache_get(cache_key)
+  if cached is not None:
+    duration_ms = (time.time() - start_time) * 1000
+    Theophrastus_Observability.log_tool_complete("geocode_place_name", success=True, duration_ms=duration_ms)
+    return {**cached, "original_query": place_name, "region_hint": region_hint}
+  
   url = "https://geocoding-api.open-meteo.com/v1/search"
   
-  def _call_api(name: str, count: int = None) -> Dict[str, Any]:
+  async def _call_api(name: str, count: int = None) -> Dict[str, Any]:
     try:
-      resp = requests.get(
+      resp = await _open_meteo_get(
         url,
         params={
           "name": name,
@@ -35,61 +224,41 @@ def geocode_place_name(place_name: str, max_results: int = 3, region_hint: Optio
         },timeout=20
       )
       resp.raise_for_status()
-      data = resp.json()
+      data = orjson.loads(resp.content)
       return {"ok": True, "data": data}
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
       return {
         "ok": False,
         "error": "timeout",
         "message": f"Timeout."
       }
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
       return {
         "ok": False,
         "error": "request_failed",
         "message": f"Request failed."
       }
+    except orjson.JSONDecodeError:
+      return {
+        "ok": False,
+        "error": "invalid_response",
+        "message": "Response was not valid JSON."
+      }
 
   cleaned = place_name.strip()
   candidates: list[str] = []
   candidates.append(cleaned)
-  suffixes_to_remove = [
-    " National Park",
-    " national park",
-    " State Park", 
-    " state park",
-    " Park",
-    " park",
-    " Forest",
-    " forest",
-    " Mountain",
-    " mountain",
-    " Volcano",
-    " volcano",
-    " Trail",
-    " trail",
-    " Reserve",
-    " reserve"
-  ]
-  
-  for suffix in suffixes_to_remove:
-    if cleaned.endswith(suffix):
-      without_suffix = cleaned[:-len(suffix)].strip()
-      if without_suffix:
-        candidates.append(without_suffix)
-      break
+  without_suffix = _strip_place_suffix(cleaned)
+  if without_suffix:
+    candidates.append(without_suffix)
   
   if region_hint:
     region_hint_clean = region_hint.strip()
     if region_hint_clean.lower() not in cleaned.lower():
       candidates.append(f"{cleaned}, {region_hint_clean}")
-      for suffix in suffixes_to_remove:
-        if cleaned.endswith(suffix):
-          without_suffix = cleaned[:-len(suffix)].strip()
-          if without_suffix:
-            candidates.append(f"{without_suffix}, {region_hint_clean}")
-          break
+      if without_suffix:
+        candidates.append(f"{without_suffix}, {region_hint_clean}")
   
   words = cleaned.split()
   if len(words) >= 3:
@@ -112,43 +281,63 @@ def geocode_place_name(place_name: str, max_results: int = 3, region_hint: Optio
   
   last_error: Dict[str, Any] | None = None
   
-  for i, candidate in enumerate(unique_candidates):
-    attempt_max_results = max_results if i == 0 else min(max_results * 2, 10)
-    api_result = _call_api(candidate, attempt_max_results)
+  async def _attempt(candidate: str) -> List[Dict[str, Any]]:
+    nonlocal last_error
+    # Only max_results are kept, so don't ask the API (or orjson) for more.
+    api_result = await _call_api(candidate, max_results)
     
     if not api_result.get("ok"):
       last_error = api_result
-      continue
+      return []
     
     data = cast(Dict[str, Any], api_result["data"])
     raw_results: List[Dict[str, Any]] = data.get("results") or []
     
-    if not raw_results:
-      continue
-    
-    results: List[Dict[str, Any]] = []
-    for r in raw_results:
-      results.append({
-        "name": r.get("name"),
-        "latitude": r.get("latitude"),
-        "longitude": r.get("longitude"),
-        "country": r.get("country"),
-        "admin1": r.get("admin1"),
-        "admin2": r.get("admin2"),
-        "population": r.get("population")
-      })
-    results = results[:max_results]
-    
+    return [{
+      "name": r.get("name"),
+      "latitude": r.get("latitude"),
+      "longitude": r.get("longitude"),
+      "country": r.get("country"),
+      "admin1": r.get("admin1"),
+      "admin2": r.get("admin2"),
+      "population": r.get("population")
+    } for r in raw_results[:max_results]]
+  
+  found: Optional[Tuple[str, List[Dict[str, Any]]]] = None
+  
+  # The exact name usually resolves on its own. Only on a miss are the fallbacks
+  # queried, all at once, still preferring them in order.
+  if unique_candidates:
+    results = await _attempt(unique_candidates[0])
     if results:
-      duration_ms = (time.time() - start_time) * 1000
-      Theophrastus_Observability.log_tool_complete("geocode_place_name", success=True, duration_ms=duration_ms)
-      return {
-        "query": candidate,
-        "original_query": place_name,
-        "results": results,
-        "source": "open_meteo_api",
-        "region_hint": region_hint
-      }
+      found = (unique_candidates[0], results)
+  
+  fallbacks = unique_candidates[1:]
+  if found is None and fallbacks:
+    tasks = [asyncio.ensure_future(_attempt(c)) for c in fallbacks]
+    try:
+      for candidate, task in zip(fallbacks, tasks):
+        results = await task
+        if results:
+          found = (candidate, results)
+          break
+    finally:
+      for task in tasks:
+        task.cancel()
+  
+  if found is not None:
+    candidate, results = found
+    duration_ms = (time.time() - start_time) * 1000
+    Theophrastus_Observability.log_tool_complete("geocode_place_name", success=True, duration_ms=duration_ms)
+    out = {
+      "query": candidate,
+      "original_query": place_name,
+      "results": results,
+      "source": "open_meteo_api",
+      "region_hint": region_hint
+    }
+    _geocode_cache_put(cache_key, out)
+    return dict(out)
 
   duration_ms = (time.time() - start_time) * 1000
   
@@ -162,96 +351,159 @@ def geocode_place_name(place_name: str, max_results: int = 3, region_hint: Optio
   if last_error is not None:
     out["error"] = last_error.get("error")
     out["error_message"] = last_error.get("message")
-    logger.warning(f"All attempts failed.\n")
+    logger.warning("All attempts failed.\n")
   else:
-    logger.warning(f"No geocoding results found.\n")
+    logger.warning("No geocoding results found.\n")
   
   Theophrastus_Observability.log_tool_complete("geocode_place_name", success=False, duration_ms=duration_ms)
   
   return out
 
-def fetch_env_snapshot_from_open_meteo(latitude: float,longitude: float) -> Dict[str, Any]:
-  """Fetches environmental snapshot from Open-Meteo API"""
-  start_time = time.time()
-  
-  Theophrastus_Observability.log_tool_call("fetch_env_snapshot_from_open_meteo", {"latitude": latitude,"longitude": longitude})
-  
+async def geocode_places_batch(tool_context, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+  """Geocodes several places concurrently, one result per place in input order"""
+  async def _geocode_one(place: Dict[str, Any]) -> Dict[str, Any]:
+    # Model-written arguments aren't guaranteed to be well-formed; one bad entry mustn't sink the batch.
+    name = place.get("name") if isinstance(place, dict) else None
+    if not isinstance(name, str) or not name.strip():
+      return {"query": place, "results": [], "error": "invalid_place", "error_message": "Expected an object with a non-empty name."}
+    region_hint = place.get("region_hint")
+    result = await geocode_place_name(name, region_hint=region_hint if isinstance(region_hint, str) else None)
+    result["activity"] = place.get("activity")
+    return result
+
+  results = list(await asyncio.gather(*(_geocode_one(p) for p in places)))
+  # Read by the geocode validation checker and the retry prompt, so a retry only re-geocodes these.
+  tool_context.state["env_location_unresolved"] = [
+    {"name": place.get("name"), "region_hint": place.get("region_hint"), "activity": place.get("activity")}
+    for place, result in zip(places, results) if not result.get("results") and result.get("error") != "invalid_place"
+  ]
+  return results
+
+def _check_coordinates(tool_name: str, latitude: float, longitude: float) -> None:
+  if (isinstance(latitude, (int, float)) and isinstance(longitude, (int, float))
+      and -90 <= latitude <= 90 and -180 <= longitude <= 180):
+    return
+  _raise_invalid_coordinates(tool_name, latitude, longitude)
+
+def _raise_invalid_coordinates(tool_name: str, latitude: Any, longitude: Any) -> None:
+  """Slow path: works out which check failed, logs it and raises"""
   if not isinstance(latitude, (int, float)) or not isinstance(longitude, (int, float)):
     error = ValueError(f"Coordinates must be Num: lat={latitude}, lon={longitude}")
-    Theophrastus_Observability.log_error("fetch_env_snapshot_from_open_meteo", error)
+    Theophrastus_Observability.log_error(tool_name, error)
     raise error
   
   if not (-90 <= latitude <= 90):
     error = ValueError(f"Invalid latitude: {latitude} (must be -90 to 90)")
-    Theophrastus_Observability.log_error("fetch_env_snapshot_from_open_meteo", error)
+    Theophrastus_Observability.log_error(tool_name, error)
     raise error
   
   if not (-180 <= longitude <= 180):
     error = ValueError(f"Invalid longitude: {longitude} (must be -180 to 180)")
-    Theophrastus_Observability.log_error("fetch_env_snapshot_from_open_meteo", error)
+    Theophrastus_Observability.log_error(tool_name, error)
     raise error
+
+_FORECAST_CACHE_TTL_S = 600.0
+_FORECAST_CACHE_SIZE = 1024
+_forecast_cache: "OrderedDict[Tuple[float, float], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_forecast_cache_lock = threading.Lock()
+
+def _forecast_cache_key(latitude: float, longitude: float) -> Tuple[float, float]:
+  # Two decimals is ~1 km, well inside a forecast grid cell.
+  return (round(latitude, 2), round(longitude, 2))
+
+def _forecast_cache_get(latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+  key = _forecast_cache_key(latitude, longitude)
+  with _forecast_cache_lock:
+    hit = _forecast_cache.get(key)
+    if hit is None:
+      return None
+    if time.monotonic() - hit[0] >= _FORECAST_CACHE_TTL_S:
+      del _forecast_cache[key]
+      return None
+    _forecast_cache.move_to_end(key)
+  return {**hit[1], "location": {"latitude": latitude, "longitude": longitude}}
+
+def _forecast_cache_put(latitude: float, longitude: float, snapshot: Dict[str, Any]) -> None:
+  key = _forecast_cache_key(latitude, longitude)
+  with _forecast_cache_lock:
+    _forecast_cache[key] = (time.monotonic(), snapshot)
+    _forecast_cache.move_to_end(key)
+    if len(_forecast_cache) > _FORECAST_CACHE_SIZE:
+      _forecast_cache.popitem(last=False)
+
+def _build_snapshot(latitude: float, longitude: float, data: Dict[str, Any]) -> Dict[str, Any]:
+  current = data.get("current") or {}
+  hourly = data.get("hourly") or {}
+  
+  return {
+    "location": {
+      "latitude": latitude,
+      "longitude": longitude
+    },
+    "current": {
+      "temperature_c": current.get("temperature_2m"),
+      "apparent_temperature_c": current.get("apparent_temperature"),
+      "relative_humidity_percent": current.get("relative_humidity_2m"),
+      "wind_speed_10m_ms": current.get("wind_speed_10m")
+    },
+    "hourly": {
+      "pm10": (hourly.get("pm10") or [])[:_HOURLY_WINDOW],
+      "pm2_5": (hourly.get("pm2_5") or [])[:_HOURLY_WINDOW]
+    }
+  }
+
+async def fetch_env_snapshot_from_open_meteo(latitude: float,longitude: float) -> Dict[str, Any]:
+  """Fetches environmental snapshot from Open-Meteo API"""
+  start_time = time.time()
+  
+  Theophrastus_Observability.log_tool_call("fetch_env_snapshot_from_open_meteo", {"latitude": latitude,"longitude": longitude})
+  
+  _check_coordinates("fetch_env_snapshot_from_open_meteo", latitude, longitude)
+  
+  cached = _forecast_cache_get(latitude, longitude)
+  if cached is not None:
+    duration_ms = (time.time() - start_time) * 1000
+    Theophrastus_Observability.log_tool_complete("fetch_env_snapshot_from_open_meteo",success=True,duration_ms=duration_ms)
+    return cached
   
-  base_url = "https://api.open-meteo.com/v1/forecast"
   params = {
     "latitude": latitude,
     "longitude": longitude,
-    "current": [
-      "temperature_2m",
-      "apparent_temperature",
-      "relative_humidity_2m",
-      "wind_speed_10m"
-    ],
-    "hourly": ["pm10", "pm2_5"],
+    "current": _FORECAST_CURRENT,
+    "hourly": _FORECAST_HOURLY,
+    "forecast_hours": _HOURLY_WINDOW,
     "timezone": "auto"
   }
   
   try:
-    logger.debug(f"Calling Open-Meteo API.\n")
-    resp = requests.get(base_url, params=params, timeout=10)
+    logger.debug("Calling Open-Meteo API.\n")
+    resp = await _open_meteo_get(_FORECAST_URL, params=params)
     resp.raise_for_status()
-    data = resp.json()
-    
-    current = data.get("current", {})
-    hourly = data.get("hourly", {})
+    data = orjson.loads(resp.content)
     
-    snapshot = {
-      "location": {
-        "latitude": latitude,
-        "longitude": longitude
-      },
-      "current": {
-        "temperature_c": current.get("temperature_2m"),
-        "apparent_temperature_c": current.get("apparent_temperature"),
-        "relative_humidity_percent": current.get("relative_humidity_2m"),
-        "wind_speed_10m_ms": current.get("wind_speed_10m")
-      },
-      "hourly": {
-        "pm10": hourly.get("pm10"),
-        "pm2_5": hourly.get("pm2_5")
-      },
-      "raw": data
-    }
+    snapshot = _build_snapshot(latitude, longitude, data)
+    _forecast_cache_put(latitude, longitude, snapshot)
 
     duration_ms = (time.time() - start_time) * 1000
     Theophrastus_Observability.log_tool_complete("fetch_env_snapshot_from_open_meteo",success=True,duration_ms=duration_ms)
     
-    logger.info(f"Successfully fetched snapshot for ({latitude}, {longitude}). \n")
+    logger.info("Successfully fetched snapshot for (%s, %s). \n", latitude, longitude)
     
     return snapshot
   
-  except requests.Timeout as e:
+  except httpx.TimeoutException as e:
     duration_ms = (time.time() - start_time) * 1000
     Theophrastus_Observability.log_error("fetch_env_snapshot_from_open_meteo",e,details=f"Timeout after {duration_ms:.0f}ms")
     Theophrastus_Observability.log_tool_complete("fetch_env_snapshot_from_open_meteo",success=False,duration_ms=duration_ms)
     raise
   
-  except requests.HTTPError as e:
+  except httpx.HTTPStatusError as e:
     duration_ms = (time.time() - start_time) * 1000
     Theophrastus_Observability.log_error("fetch_env_snapshot_from_open_meteo",e,details=f"HTTP {resp.status_code}: {resp.text[:200]}")
     Theophrastus_Observability.log_tool_complete("fetch_env_snapshot_from_open_meteo",success=False,duration_ms=duration_ms)
     raise
   
-  except requests.RequestException as e:
+  except httpx.HTTPError as e:
     duration_ms = (time.time() - start_time) * 1000
     Theophrastus_Observability.log_error("fetch_env_snapshot_from_open_meteo",e,details="Request failed")
     Theophrastus_Observability.log_tool_complete("fetch_env_snapshot_from_open_meteo",success=False,duration_ms=duration_ms)
@@ -263,17 +515,80 @@ def fetch_env_snapshot_from_open_meteo(latitude: float,longitude: float) -> Dict
     Theophrastus_Observability.log_tool_complete("fetch_env_snapshot_from_open_meteo",success=False,duration_ms=duration_ms)
     raise
 
-def fetch_and_store_snapshot(latitude: float, longitude: float) -> Dict[str, Any]:
-  """Wrapper for fetch_env_snapshot_from_open_meteo"""
-  global _last_snapshot
-  _last_snapshot = fetch_env_snapshot_from_open_meteo(latitude, longitude)
-  logger.debug(f"Stored snapshot in global cache for ({latitude}, {longitude})")
-  return _last_snapshot
+async def fetch_env_snapshots_from_open_meteo(latitudes: List[float], longitudes: List[float]) -> List[Dict[str, Any]]:
+  """Fetches environmental snapshots for several coordinates in a single Open-Meteo request"""
+  start_time = time.time()
+  
+  Theophrastus_Observability.log_tool_call("fetch_env_snapshots_from_open_meteo", {"latitudes": latitudes,"longitudes": longitudes})
+  
+  if len(latitudes) != len(longitudes) or not latitudes:
+    error = ValueError(f"Expected matching non-empty coordinate lists: {len(latitudes)} latitudes, {len(longitudes)} longitudes")
+    Theophrastus_Observability.log_error("fetch_env_snapshots_from_open_meteo", error)
+    raise error
+  
+  for latitude, longitude in zip(latitudes, longitudes):
+    _check_coordinates("fetch_env_snapshots_from_open_meteo", latitude, longitude)
+  
+  snapshots = [_forecast_cache_get(lat, lon) for lat, lon in zip(latitudes, longitudes)]
+  missing = [i for i, snap in enumerate(snapshots) if snap is None]
+  if not missing:
+    duration_ms = (time.time() - start_time) * 1000
+    Theophrastus_Observability.log_tool_complete("fetch_env_snapshots_from_open_meteo",success=True,duration_ms=duration_ms)
+    return snapshots
+  
+  params = {
+    "latitude": ",".join(str(latitudes[i]) for i in missing),
+    "longitude": ",".join(str(longitudes[i]) for i in missing),
+    "current": _FORECAST_CURRENT,
+    "hourly": _FORECAST_HOURLY,
+    "forecast_hours": _HOURLY_WINDOW,
+    "timezone": "auto"
+  }
+  
+  try:
+    resp = await _open_meteo_get(_FORECAST_URL, params=params)
+    resp.raise_for_status()
+    data = orjson.loads(resp.content)
+    if isinstance(data, dict):
+      data = [data]
+    if len(data) != len(missing):
+      raise ValueError(f"Open-Meteo returned {len(data)} forecasts for {len(missing)} requested locations")
+    
+    for i, d in zip(missing, data):
+      snapshots[i] = _build_snapshot(latitudes[i], longitudes[i], d)
+      _forecast_cache_put(latitudes[i], longitudes[i], snapshots[i])
+    
+    duration_ms = (time.time() - start_time) * 1000
+    Theophrastus_Observability.log_tool_complete("fetch_env_snapshots_from_open_meteo",success=True,duration_ms=duration_ms)
+    
+    logger.info("Successfully fetched %d snapshots. \n", len(snapshots))
+    
+    return snapshots
+  
+  except httpx.HTTPStatusError as e:
+    duration_ms = (time.time() - start_time) * 1000
+    Theophrastus_Observability.log_error("fetch_env_snapshots_from_open_meteo",e,details=f"HTTP {resp.status_code}: {resp.text[:200]}")
+    Theophrastus_Observability.log_tool_complete("fetch_env_snapshots_from_open_meteo",success=False,duration_ms=duration_ms)
+    raise
+  
+  except Exception as e:
+    duration_ms = (time.time() - start_time) * 1000
+    Theophrastus_Observability.log_error("fetch_env_snapshots_from_open_meteo",e,details="Request failed")
+    Theophrastus_Observability.log_tool_complete("fetch_env_snapshots_from_open_meteo",success=False,duration_ms=duration_ms)
+    raise
 
+async def fetch_and_store_snapshots(tool_context, latitudes: List[float], longitudes: List[float]) -> List[Dict[str, Any]]:
+  """Fetches snapshots for several coordinates and stores them in session state"""
+  snapshots = await fetch_env_snapshots_from_open_meteo(latitudes, longitudes)
+  tool_context.state["env_snapshot"] = snapshots
+  session_cache.store_evaluation_data(tool_context.session.id, {"env_snapshot": snapshots})
+  logger.debug("Stored %d snapshots in session state", len(snapshots))
+  return snapshots
 
-def get_last_snapshot() -> Dict[str, Any]:
-  """Retrieve last snapshot"""
-  global _last_snapshot
-  snapshot = _last_snapshot
-  _last_snapshot = None
-  return snapshot
\ No newline at end of file
+async def fetch_and_store_snapshot(tool_context, latitude: float, longitude: float) -> Dict[str, Any]:
+  """Fetches a snapshot and stores it in session state"""
+  snapshot = await fetch_env_snapshot_from_open_meteo(latitude, longitude)
+  tool_context.state["env_snapshot"] = snapshot
+  session_cache.store_evaluation_data(tool_context.session.id, {"env_snapshot": snapshot})
+  logger.debug("Stored snapshot in session state for (%s, %s)", latitude, longitude)
+  return snapshot
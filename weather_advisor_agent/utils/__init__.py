@@ -1,10 +1,25 @@
-from .local_observability import Theophrastus_Observability
+import importlib
 
-from .local_evaluator import TheophrastusEvaluator
-
-from . import session_cache
+# Resolved on first access so the agent doesn't import the evaluator it never uses.
+_LAZY = {
+  "Theophrastus_Observability": (".local_observability", "Theophrastus_Observability"),
+  "TheophrastusEvaluator": (".local_evaluator", "TheophrastusEvaluator"),
+  "session_cache": (".session_cache", None),
+}
 
 __all__ = ["Theophrastus_Observability",
   "TheophrastusEvaluator",
   "session_cache",
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+  if name not in _LAZY:
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+  module_name, attr = _LAZY[name]
+  module = importlib.import_module(module_name, __name__)
+  value = module if attr is None else getattr(module, attr)
+  globals()[name] = value
+  return value
+
+def __dir__():
+  return sorted(list(globals()) + __all__)
@@ -5,12 +5,13 @@ Useful to see how efective is the agent is working and if something is missing w
 Helped me to localize loss of agent keys requiered for each response.
 Still working in the functionality for 1,2 output keys cases.
 """
-import json
 import logging
 import datetime
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,15 @@ class EvaluationResult:
     if self.timestamp is None:
       self.timestamp = datetime.datetime.now().isoformat()
 
+  def to_dict(self) -> Dict[str, Any]:
+    return {
+      "category": self.category,
+      "score": self.score,
+      "details": self.details,
+      "passed": self.passed,
+      "timestamp": self.timestamp
+    }
+
 @dataclass
 class FullEvaluationReport:
   """Complete evaluation report for a Theophrastus run"""
@@ -43,7 +53,7 @@ class FullEvaluationReport:
       "timestamp": self.timestamp,
       "overall_score": self.overall_score,
       "passed": self.passed,
-      "evaluations": [asdict(e) for e in self.evaluations],
+      "evaluations": [e.to_dict() for e in self.evaluations],
       "summary": self.summary
     }
 
@@ -125,8 +135,8 @@ class TheophrastusEvaluator:
     
     if isinstance(env_risk_report, str):
       try:
-        env_risk_report = json.loads(env_risk_report)
-      except json.JSONDecodeError:
+        env_risk_report = orjson.loads(env_risk_report)
+      except orjson.JSONDecodeError:
         return EvaluationResult(
           category="risk_assessment",
           score=0.0,
@@ -392,7 +402,7 @@ class TheophrastusEvaluator:
           # Parse if string
           if isinstance(snapshot, str):
               try:
-                  snapshot = json.loads(snapshot)
+                  snapshot = orjson.loads(snapshot)
               except:
                   pass
           evaluations.append(
@@ -459,8 +469,7 @@ class TheophrastusEvaluator:
     filename = f"evaluation_{report.session_id}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     filepath = self.output_dir / filename
     
-    with open(filepath, 'w') as f:
-      json.dump(report.to_dict(), f, indent=2)
+    filepath.write_bytes(orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
     logger.info(f"Evaluation saved to {filepath}")
     return filepath
@@ -3,13 +3,17 @@ Developed a built-in local observavility and log module
 for testing, diagnostics and watch behaviour if agents and tools.
 Useful for debbuging strange behaviours of agents when running tests without UI.
 """
+import sys
 import logging
 import time
-import json
+
+import orjson
 from datetime import datetime
 from pathlib import Path
+from collections import deque
+from itertools import islice
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 
@@ -21,7 +25,11 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+_EXPORT_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+# Oldest spans are dropped past this, so long sessions keep bounded memory.
+_MAX_TRACES = 10000
+
+@dataclass(slots=True)
 class TraceSpan:
   name: str
   start_time: float
@@ -149,13 +157,14 @@ class TheophrastusObservability:
       self.logger = logging.getLogger("Theophrastus")
       self.metrics = TheophrastusMetrics()
       self.enable_traces = enable_traces
-      self.traces: List[TraceSpan] = []
+      self.traces: Deque[TraceSpan] = deque(maxlen=_MAX_TRACES)
       self.active_spans: Dict[str, TraceSpan] = {}
     
     def log_agent_start(self, agent_name: str, context: Optional[Dict[str, Any]] = None):
       self.metrics.increment_agent_calls(agent_name)
-      context_str = f"Context: {context}" if context else ""
-      self.logger.info(f"[--AGENT--] {agent_name} {context_str} |\n")
+      if self.logger.isEnabledFor(logging.INFO):
+        context_str = f"Context: {context}" if context else ""
+        self.logger.info("[--AGENT--] %s %s |\n", agent_name, context_str)
     
     def log_agent_complete(self,agent_name: str,output_key: str,success: bool = True,duration_ms: Optional[float] = None):
       if success:
@@ -165,15 +174,16 @@ class TheophrastusObservability:
         self.metrics.failed_operations += 1
         status = "FAILED"
       
-      self.logger.info(f"[--AGENT--] {agent_name} | Output: {output_key} | {status} |\n")
+      self.logger.info("[--AGENT--] %s | Output: %s | %s |\n", agent_name, output_key, status)
       
       if duration_ms:
         self.metrics.record_agent_duration(agent_name, duration_ms)
     
     def log_tool_call(self, tool_name: str, params: Dict[str, Any]):
       self.metrics.increment_tool_calls(tool_name)
-      param_preview = str(params)[:100]
-      self.logger.info(f"[--TOOL--] {tool_name} | Params: {param_preview} |\n")
+      # Rendering the params dict is the expensive part; skip it when INFO is off.
+      if self.logger.isEnabledFor(logging.INFO):
+        self.logger.info("[--TOOL--] %s | Params: %s |\n", tool_name, str(params)[:100])
     
     def log_tool_complete(self,tool_name: str,success: bool = True,duration_ms: Optional[float] = None):
       if success:
@@ -181,7 +191,7 @@ class TheophrastusObservability:
       else:
         status = "FAILED"
 
-      self.logger.info(f"[--TOOL--] {tool_name} | {status} |\n")
+      self.logger.info("[--TOOL--] %s | %s |\n", tool_name, status)
       
       if duration_ms:
         self.metrics.record_tool_duration(tool_name, duration_ms)
@@ -196,16 +206,17 @@ class TheophrastusObservability:
       else:
         status = "NOT PASSED"
 
-      self.logger.info(f"[--VALIDATION--] {checker_name} | {status} |\n")
+      self.logger.info("[--VALIDATION--] %s | %s |\n", checker_name, status)
   
     def log_error(self, context: str, error: Exception, details: Optional[str] = None):
       error_type = type(error).__name__
       self.metrics.record_error(error_type)
-      self.logger.error(f"[--ERROR--] {context} | {error_type}: {str(error)} |\n",exc_info=True)
+      self.logger.error("[--ERROR--] %s | %s: %s |\n", context, error_type, error, exc_info=True)
     
     def log_state_change(self, key: str, action: str, value_preview: str = ""):
-      preview = f"Value: {value_preview[:50]}" if value_preview else ""
-      self.logger.debug(f"[--STATE--] {action} key '{key}' {preview} |\n")
+      if self.logger.isEnabledFor(logging.DEBUG):
+        preview = f"Value: {value_preview[:50]}" if value_preview else ""
+        self.logger.debug("[--STATE--] %s key '%s' %s |\n", action, key, preview)
     
 
     @contextmanager
@@ -214,21 +225,24 @@ class TheophrastusObservability:
         yield None
         return
       
-      span = TraceSpan(name=operation_name,start_time=time.time(),parent_span_id=parent_span_id,attributes=attributes or {})
+      # Spans repeat the same few attribute names, so share one copy of each. Values are often
+      # user text (queries, descriptions) and are left alone so they can be freed with the span.
+      attributes = {sys.intern(k) if type(k) is str else k: v for k, v in (attributes or {}).items()}
+      span = TraceSpan(name=operation_name,start_time=time.time(),parent_span_id=parent_span_id,attributes=attributes)
       self.active_spans[span.span_id] = span
-      self.logger.debug(f"[--TRACE--] {operation_name} | span_id: {span.span_id} |\n")
+      self.logger.debug("[--TRACE--] %s | span_id: %s |\n", operation_name, span.span_id)
       
       try:
         yield span
         span.status = "success"
         span.end_time = time.time()
-        self.logger.debug(f"[--TRACE--] {operation_name} | Success |\n")
+        self.logger.debug("[--TRACE--] %s | Success |\n", operation_name)
       except Exception as e:
         span.status = "error"
         span.end_time = time.time()
         span.attributes["error"] = str(e)
         span.attributes["error_type"] = type(e).__name__
-        self.logger.debug(f"[--TRACE--] {operation_name} | Error | Type: {type(e).__name__} |\n")
+        self.logger.debug("[--TRACE--] %s | Error | Type: %s |\n", operation_name, span.attributes["error_type"])
         raise
       finally:
         self.traces.append(span)
@@ -255,7 +269,7 @@ class TheophrastusObservability:
         "avg_duration_ms": avg_duration,
         "max_duration_ms": max_duration,
         "min_duration_ms": min_duration,
-        "traces": [t.to_dict() for t in self.traces[-10:]]
+        "traces": [t.to_dict() for t in islice(self.traces, max(total_traces - 10, 0), None)]
       }
     
     def export_traces(self, filename: str):
@@ -267,8 +281,7 @@ class TheophrastusObservability:
       full_path = base_dir / file
       full_path.parent.mkdir(parents=True, exist_ok=True)
 
-      with open(full_path, 'w') as f:
-        json.dump(trace_data, f, indent=2)
+      full_path.write_bytes(orjson.dumps(trace_data, option=_EXPORT_OPTIONS))
 
     def get_metrics_summary(self) -> Dict[str, Any]:
       """Get comprehensive metrics summary"""
@@ -285,8 +298,7 @@ class TheophrastusObservability:
       full_path = base_dir / file
       full_path.parent.mkdir(parents=True, exist_ok=True)
 
-      with open(full_path, 'w') as f:
-        json.dump(self.metrics.get_summary(), f, indent=2)
+      full_path.write_bytes(orjson.dumps(self.metrics.get_summary(), option=_EXPORT_OPTIONS))
         
 
 Theophrastus_Observability = TheophrastusObservability(enable_traces=True)
@@ -0,0 +1,62 @@
+"""
+Shared after-agent callback for agents whose output_key holds JSON written by the model.
+"""
+import logging
+
+import orjson
+
+from weather_advisor_agent.utils import Theophrastus_Observability, session_cache
+
+logger = logging.getLogger(__name__)
+
+def parse_json_output(text: str):
+  """Parses model output that may be wrapped in a markdown code fence"""
+  text = text.strip()
+  start = 7 if text.startswith("```json") else 3 if text.startswith("```") else 0
+  end = -3 if text.endswith("```") and len(text) >= start + 3 else None
+  if start or end:
+    # Only fenced output needs the inner whitespace trimmed; orjson skips the rest.
+    text = text[start:end].strip()
+  return orjson.loads(text)
+
+def make_output_callback(agent_name: str, state_key: str, expected_type: type, require_items: bool = False):
+  """Builds an after_agent_callback that parses, checks and stores an agent's JSON output"""
+  log_agent_complete = Theophrastus_Observability.log_agent_complete
+  store_evaluation_data = session_cache.store_evaluation_data
+
+  def callback(*args, **kwargs):
+    ctx = kwargs.get("callback_context")
+    if ctx is None and len(args) >= 2:
+      ctx = args[1]
+    if ctx is None:
+      return None
+
+    session = ctx.session
+    state = session.state
+    value = state.get(state_key)
+
+    # Session state only holds plain JSON types, so exact type checks are enough here.
+    if value.__class__ is str:
+      logger.warning("%s returned a string instead of a %s.", agent_name, expected_type.__name__)
+      try:
+        value = parse_json_output(value)
+      except orjson.JSONDecodeError as e:
+        logger.error("Could not parse %s: %s", state_key, e)
+        return None
+
+    if value.__class__ is expected_type and (value or not require_items):
+      state[state_key] = value
+      store_evaluation_data(session.id, {state_key: value})
+
+      log_agent_complete(agent_name, state_key, success=True)
+      logger.info("Stored %s.", state_key)
+
+      return None
+    else:
+      logger.warning("No %s or invalid format.", state_key)
+      log_agent_complete(agent_name, state_key, success=False)
+
+      return None
+
+  callback.__name__ = callback.__qualname__ = f"{agent_name}_output_callback"
+  return callback
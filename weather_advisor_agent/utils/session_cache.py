@@ -17,11 +17,12 @@ def store_evaluation_data(session_id: str, data: Dict[str, Any]) -> None:
     _session_cache[session_id] = {}
   
   _session_cache[session_id].update(data)
-  logger.debug(f"Cached {list(data.keys())} for session {session_id}.")
+  if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("Cached %s for session %s.", list(data), session_id)
 
 
 def get_evaluation_data(session_id: str) -> Dict[str, Any]:
   """Retrieve evaluation data for a session"""
   data = _session_cache.get(session_id, {}).copy()
-  logger.info(f"Retrieved {len(data)} keys from cache for session {session_id}.")
+  logger.info("Retrieved %d keys from cache for session %s.", len(data), session_id)
   return data
\ No newline at end of file
@@ -1,6 +1,7 @@
-import json
 import logging
 
+import orjson
+
 from typing import AsyncGenerator
 
 from google.genai.types import Content,Part
@@ -9,7 +10,7 @@ from google.adk.agents.invocation_context import InvocationContext
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.events import Event, EventActions
 
-from weather_advisor_agent.utils import Theophrastus_Observability
+from weather_advisor_agent.utils import Theophrastus_Observability, session_cache
 
 
 logger = logging.getLogger(__name__)
@@ -22,10 +23,10 @@ class EnvSnapshotValidationChecker(BaseAgent):
     
     if isinstance(snapshot, str):
       try:
-        snapshot = json.loads(snapshot)
+        snapshot = orjson.loads(snapshot)
         logger.debug("Parsed env_snapshot from JSON string")
-      except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse env_snapshot JSON: {e}")
+      except orjson.JSONDecodeError as e:
+        logger.error("Failed to parse env_snapshot JSON: %s", e)
         snapshot = None
     
     def is_valid_snapshot(snap: dict) -> bool:
@@ -44,7 +45,7 @@ class EnvSnapshotValidationChecker(BaseAgent):
       has_data = any(v is not None for v in (temp, feels_like, wind, humidity))
       
       if has_data:
-        logger.debug(f"Valid snapshot: temp={temp}, feels={feels_like}, wind={wind}, humidity={humidity}")
+        logger.debug("Valid snapshot: temp=%s, feels=%s, wind=%s, humidity=%s", temp, feels_like, wind, humidity)
       
       return has_data
     
@@ -65,9 +66,9 @@ class EnvSnapshotValidationChecker(BaseAgent):
         valid_count = len(valid_snapshots)
         total_count = len(snapshot)
         is_valid = valid_count > 0
-        logger.info(f"{valid_count}/{total_count} snapshots valid")
+        logger.info("%d/%d snapshots valid", valid_count, total_count)
     else:
-      logger.error(f"Unexpected snapshot type: {type(snapshot).__name__}.")
+      logger.error("Unexpected snapshot type: %s.", type(snapshot).__name__)
     
     Theophrastus_Observability.log_validation("EnvSnapshotValidationChecker", passed=is_valid, details=validation_details)
     Theophrastus_Observability.log_agent_complete("EnvSnapshotValidationChecker", "env_snapshot", success=is_valid)
@@ -89,10 +90,10 @@ class EnvRiskValidationChecker(BaseAgent):
     else:
       if isinstance(risk_report, str):
         try:
-          risk_report = json.loads(risk_report)
+          risk_report = orjson.loads(risk_report)
           logger.debug("Parsed risk_report from JSON string.")
-        except json.JSONDecodeError as e:
-          logger.error(f"Failed to parse risk_report JSON: {e}.")
+        except orjson.JSONDecodeError as e:
+          logger.error("Failed to parse risk_report JSON: %s.", e)
           validation_details = f"Invalid JSON: {str(e)}."
           Theophrastus_Observability.log_validation("EnvRiskValidationChecker",passed=False,details=validation_details)
           Theophrastus_Observability.log_agent_complete("EnvRiskValidationChecker","env_risk_report",success=False)
@@ -101,7 +102,7 @@ class EnvRiskValidationChecker(BaseAgent):
           return
       
       if not isinstance(risk_report, dict):
-        logger.error(f"risk_report is not a dict after parsing: {type(risk_report)}")
+        logger.error("risk_report is not a dict after parsing: %s", type(risk_report))
         validation_details = f"Expected dict, got {type(risk_report).__name__}"
       else:
         valid_levels = {"low", "moderate", "medium", "high", "unknown"}
@@ -110,7 +111,7 @@ class EnvRiskValidationChecker(BaseAgent):
         
         if overall_valid:
           is_valid = True
-          logger.info(f"Risk report valid, overall_risk={risk_report['overall_risk']}")
+          logger.info("Risk report valid, overall_risk=%s", risk_report["overall_risk"])
         else:
           logger.warning("Risk report missing or invalid overall_risk")
           validation_details = "Missing or invalid overall_risk field"
@@ -129,9 +130,13 @@ class EnvLocationGeoValidationChecker(BaseAgent):
     
     state = context.session.state
     locations = state.get("env_location_options")
+    # Locations resolved on an earlier iteration; a retry's output only holds the retried subset.
+    previous = state.get("env_location_resolved") or []
+    # geocode_places_batch records the places it could not resolve.
+    unresolved = list(state.get("env_location_unresolved") or [])
     validation_details = ""
     
-    if not locations:
+    if not locations and not previous and not unresolved:
       logger.info("No location options found - passing through to allow upstream handling")
       validation_details = "No locations to validate - empty list"
       Theophrastus_Observability.log_validation("EnvLocationGeoValidationChecker", passed=True, details=validation_details)
@@ -140,16 +145,17 @@ class EnvLocationGeoValidationChecker(BaseAgent):
       return
     
     if not isinstance(locations, list):
-      logger.warning(f"Locations is not a list (type: {type(locations).__name__}), converting to empty list")
+      logger.warning("Locations is not a list (type: %s), converting to empty list", type(locations).__name__)
       locations = []
     
     cleaned = []
+    unresolved_names = {u.get("name") for u in unresolved if isinstance(u, dict)}
     seen_coords = set()
     invalid_count = 0
     
-    for loc in locations:
+    for loc in previous + locations:
       if not isinstance(loc, dict):
-        logger.debug(f"Skipping non-dict location: {type(loc).__name__}")
+        logger.debug("Skipping non-dict location: %s", type(loc).__name__)
         invalid_count += 1
         continue
       
@@ -158,8 +164,11 @@ class EnvLocationGeoValidationChecker(BaseAgent):
       name = loc.get("name")
       
       if lat is None or lon is None:
-        logger.debug(f"Skipping location without coordinates: {name}")
+        logger.debug("Skipping location without coordinates: %s", name)
         invalid_count += 1
+        if name and name not in unresolved_names:
+          unresolved_names.add(name)
+          unresolved.append({"name": name, "region_hint": loc.get("region_hint"), "activity": loc.get("activity")})
         continue
       
       try:
@@ -167,18 +176,18 @@ class EnvLocationGeoValidationChecker(BaseAgent):
         lon_f = float(lon)
 
         if not (-90 <= lat_f <= 90) or not (-180 <= lon_f <= 180):
-          logger.warning(f"Invalid coordinates for {name}: lat={lat_f}, lon={lon_f}")
+          logger.warning("Invalid coordinates for %s: lat=%s, lon=%s", name, lat_f, lon_f)
           invalid_count += 1
           continue    
       except (TypeError, ValueError) as e:
-        logger.warning(f"Could not parse coordinates for {name}: {e}")
+        logger.warning("Could not parse coordinates for %s: %s", name, e)
         invalid_count += 1
         continue
 
       key = (round(lat_f, 4), round(lon_f, 4))
 
       if key in seen_coords:
-        logger.debug(f"Duplicate coordinates detected for {name}, skipping")
+        logger.debug("Duplicate coordinates detected for %s, skipping", name)
         invalid_count += 1
         continue
       seen_coords.add(key)
@@ -194,16 +203,25 @@ class EnvLocationGeoValidationChecker(BaseAgent):
         "source": loc.get("source", "atlas+geocode")
       })
     
-    state["env_location_options"] = cleaned
-    
-    validation_details = (f"Cleaned location list: {len(cleaned)} valid, {invalid_count} invalid/duplicate")
+    validation_details = (f"Cleaned location list: {len(cleaned)} valid, {invalid_count} invalid/duplicate, {len(unresolved)} unresolved")
     
+    # Discovery often names trails or viewpoints the geocoder can't resolve; a partial
+    # result is good enough, and only an empty one costs another geocode turn.
     passed = len(cleaned) > 0
 
     Theophrastus_Observability.log_validation("EnvLocationGeoValidationChecker", passed=passed, details=validation_details)
     Theophrastus_Observability.log_agent_complete("EnvLocationGeoValidationChecker", "env_location_options", success=passed)
 
-    yield Event(author=self.name, actions=EventActions(escalate=passed))
+    # The geocode agent's callback only cached this iteration's output; replace it with the merged list.
+    session_cache.store_evaluation_data(context.session.id, {"env_location_options": cleaned})
+
+    # Discovery output lives under env_location_candidates, so this never overwrites the candidates.
+    state_delta = {
+      "env_location_options": cleaned,
+      "env_location_resolved": cleaned,
+      "env_location_unresolved": [] if passed else unresolved
+    }
+    yield Event(author=self.name, actions=EventActions(escalate=passed, state_delta=state_delta))
 
 #Deprecated functionality, keeping for documentation and test purposes.
 #Prevented Aurora malfunction, current configuration allows it to work.